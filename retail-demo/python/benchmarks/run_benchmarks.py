@@ -0,0 +1,110 @@
+import argparse
+import json
+import os
+import sys
+from configs.config import (
+    BENCHMARK_SEED,
+    BENCHMARK_REGRESSION_THRESHOLD,
+    BENCHMARK_THROTTLE_RATE_TOLERANCE,
+)
+from core.logging_config import get_logger
+from benchmarks.suite import BENCHMARKS, WORKLOAD, run_benchmark
+
+logger = get_logger()
+
+BASELINES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+
+def find_regressions(name, result, baseline, threshold):
+    regressions = []
+    if result["throughput"] < baseline["throughput"] * (1 - threshold):
+        regressions.append(
+            f"{name}: throughput {result['throughput']} < baseline {baseline['throughput']}"
+        )
+    if (
+        baseline["p99_latency_ms"] is not None
+        and result["p99_latency_ms"] is not None
+        and result["p99_latency_ms"] > baseline["p99_latency_ms"] * (1 + threshold)
+    ):
+        regressions.append(
+            f"{name}: p99 latency {result['p99_latency_ms']}ms > baseline {baseline['p99_latency_ms']}ms"
+        )
+    if result["throttle_rate"] > baseline["throttle_rate"] + BENCHMARK_THROTTLE_RATE_TOLERANCE:
+        regressions.append(
+            f"{name}: 429 rate {result['throttle_rate']} > baseline {baseline['throttle_rate']}"
+        )
+    return regressions
+
+
+def find_setting_mismatches(name, baseline, seed):
+    # Results are only comparable when recorded with the same seed and workload
+    if baseline.get("seed") is None or baseline.get("workload") is None:
+        return [f"{name}: baseline has no recorded seed or workload, re-record it with --update-baselines"]
+    mismatches = []
+    if baseline["seed"] != seed:
+        mismatches.append(f"{name}: baseline was recorded with seed {baseline['seed']}, not {seed}")
+    for setting in sorted(set(WORKLOAD) | set(baseline["workload"])):
+        if baseline["workload"].get(setting) != WORKLOAD.get(setting):
+            mismatches.append(
+                f"{name}: baseline was recorded with {setting}={baseline['workload'].get(setting)}, not {WORKLOAD.get(setting)}"
+            )
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline throughput bucket benchmark suite")
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED)
+    parser.add_argument("--threshold", type=float, default=BENCHMARK_REGRESSION_THRESHOLD)
+    parser.add_argument("--update-baselines", action="store_true", help="Store results as the new baselines")
+    parser.add_argument("benchmarks", nargs="*", help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    args = parser.parse_args(argv)
+
+    names = args.benchmarks or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    results = {}
+    for name in names:
+        results[name] = run_benchmark(name, args.seed)
+        logger.info(f"[Benchmark] {name}: {results[name]}")
+
+    baselines = {"benchmarks": {}}
+    if os.path.exists(BASELINES_FILE):
+        with open(BASELINES_FILE, "r", encoding="utf-8") as f:
+            baselines = json.load(f)
+
+    if args.update_baselines:
+        # Each baseline records its own seed and workload, so updating a subset never mislabels the rest
+        for name, result in results.items():
+            baselines["benchmarks"][name] = dict(result, seed=args.seed, workload=WORKLOAD)
+        with open(BASELINES_FILE, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        logger.info(f"[Benchmark] Baselines written to {BASELINES_FILE}")
+        return 0
+
+    regressions = []
+    setting_mismatches = []
+    for name, result in results.items():
+        baseline = baselines["benchmarks"].get(name)
+        if baseline is None:
+            logger.warning(f"[Benchmark] No baseline for {name}, skipping comparison")
+            continue
+        mismatches = find_setting_mismatches(name, baseline, args.seed)
+        if mismatches:
+            setting_mismatches += mismatches
+            continue
+        regressions += find_regressions(name, result, baseline, args.threshold)
+
+    for mismatch in setting_mismatches:
+        logger.error(f"[Benchmark] Not comparable - {mismatch}")
+    for regression in regressions:
+        logger.error(f"[Benchmark] Regression - {regression}")
+    if regressions or setting_mismatches:
+        return 1
+    logger.info("[Benchmark] No regressions against baselines")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+import asyncio
+import random
+from configs.config import (
+    CONTAINER_THROUGHPUT,
+    INVENTORY_JOB_THROUGHPUT_BUCKET,
+    BASIC_TENANTS_THROUGHPUT_BUCKET,
+    INVENTORY_JOB_BUCKET_PERCENT,
+    BASIC_TENANTS_BUCKET_PERCENT,
+    BENCHMARK_OFFERED_OPS_PER_SECOND,
+    BENCHMARK_INGESTION_OPS_PER_SECOND,
+    BENCHMARK_NUM_QUERIES,
+    BENCHMARK_DOCS_TO_INSERT,
+    BENCHMARK_INGESTION_DOCS,
+    INVENTORY_JOB_CONCURRENCY,
+)
+from core.local_backend import (
+    LocalContainer,
+    LocalDocumentStore,
+    LocalSyncContainer,
+    LocalThroughputModel,
+)
+from models.product import Product, get_all_product_types
+from models.tenant_sku_mapping import get_basic_sku_tenants, get_premium_sku_tenants
+from scenarios.simulate_inventory_job import upsert_products
+from scenarios.simulate_searches import build_query_tasks
+from scripts.data_ingestion import ingest_products, load_products
+
+BUCKET_PERCENTAGES = {
+    INVENTORY_JOB_THROUGHPUT_BUCKET: INVENTORY_JOB_BUCKET_PERCENT,
+    BASIC_TENANTS_THROUGHPUT_BUCKET: BASIC_TENANTS_BUCKET_PERCENT,
+}
+
+# Settings that shape every benchmark; stored with each baseline (JSON-friendly keys)
+WORKLOAD = {
+    "container_throughput": CONTAINER_THROUGHPUT,
+    "bucket_percentages": {str(bucket): percent for bucket, percent in BUCKET_PERCENTAGES.items()},
+    "offered_ops_per_second": BENCHMARK_OFFERED_OPS_PER_SECOND,
+    "ingestion_ops_per_second": BENCHMARK_INGESTION_OPS_PER_SECOND,
+    "num_queries": BENCHMARK_NUM_QUERIES,
+    "docs_to_insert": BENCHMARK_DOCS_TO_INSERT,
+    "ingestion_docs": BENCHMARK_INGESTION_DOCS,
+    "concurrency": INVENTORY_JOB_CONCURRENCY,
+}
+
+
+def create_model(offered_ops_per_second=BENCHMARK_OFFERED_OPS_PER_SECOND):
+    return LocalThroughputModel(offered_ops_per_second, bucket_percentages=BUCKET_PERCENTAGES)
+
+
+def shuffled_query_tasks(container, rng, num_queries):
+    # Arrival order of concurrent tenants is arbitrary; fix it with the seed
+    tasks = build_query_tasks(
+        container,
+        get_basic_sku_tenants(),
+        get_premium_sku_tenants(),
+        get_all_product_types(),
+        BASIC_TENANTS_THROUGHPUT_BUCKET,
+        num_queries,
+    )
+    rng.shuffle(tasks)
+    return tasks
+
+
+async def benchmark_search(rng):
+    model = create_model()
+    container = LocalContainer(model, documents=LocalDocumentStore(load_products()))
+    await asyncio.gather(*shuffled_query_tasks(container, rng, BENCHMARK_NUM_QUERIES))
+    return model.summary()
+
+
+async def benchmark_bulk_upsert(rng):
+    model = create_model()
+    container = LocalContainer(model, throughput_bucket=INVENTORY_JOB_THROUGHPUT_BUCKET)
+    products = [Product.generate_product(rng=rng) for _ in range(BENCHMARK_DOCS_TO_INSERT)]
+    await upsert_products(container, products, INVENTORY_JOB_CONCURRENCY)
+    return model.summary()
+
+
+async def benchmark_mixed_workload(rng):
+    # Inventory job and tenant searches share one container's RU budget
+    model = create_model()
+    documents = LocalDocumentStore(load_products())
+    search_container = LocalContainer(model, documents=documents)
+    inventory_container = LocalContainer(
+        model, throughput_bucket=INVENTORY_JOB_THROUGHPUT_BUCKET, documents=documents
+    )
+    products = [Product.generate_product(rng=rng) for _ in range(BENCHMARK_DOCS_TO_INSERT)]
+    await asyncio.gather(
+        upsert_products(inventory_container, products, INVENTORY_JOB_CONCURRENCY),
+        *shuffled_query_tasks(search_container, rng, BENCHMARK_NUM_QUERIES),
+    )
+    return model.summary()
+
+
+async def benchmark_ingestion(rng):
+    model = create_model(BENCHMARK_INGESTION_OPS_PER_SECOND)
+    container = LocalSyncContainer(model)
+    products = load_products()
+    ingest_products(container, rng.sample(products, min(BENCHMARK_INGESTION_DOCS, len(products))))
+    return model.summary()
+
+
+BENCHMARKS = {
+    "search": benchmark_search,
+    "bulk_upsert": benchmark_bulk_upsert,
+    "mixed_workload": benchmark_mixed_workload,
+    "ingestion": benchmark_ingestion,
+}
+
+
+def run_benchmark(name, seed):
+    # Fresh generator per benchmark so results don't depend on which others ran
+    return asyncio.run(BENCHMARKS[name](random.Random(seed)))
@@ -18,3 +18,47 @@ NUM_QUERIES = 60
 NUM_QUERIES_INVENTORY_JOB = 10
 INVENTORY_JOB_DOCS_TO_INSERT = 1000
 INVENTORY_JOB_CONCURRENCY = 30
+
+# Bucket percentages configured in the portal (used as the static baseline)
+INVENTORY_JOB_BUCKET_PERCENT = 10
+BASIC_TENANTS_BUCKET_PERCENT = 50
+
+# Adaptive bucket controller
+# Run the controller alongside scenarios 1 and 2 (dry run: logs percentages, does not apply them)
+ADAPTIVE_BUCKET_CONTROLLER = False
+BUCKET_CONTROLLER_WINDOW_SECONDS = 60
+BUCKET_CONTROLLER_INTERVAL_SECONDS = 30
+BUCKET_CHANGE_COOLDOWN_SECONDS = 300
+BUCKET_MIN_CHANGE_PERCENT = 5
+BUCKET_MIN_PERCENT = 5
+BUCKET_MAX_PERCENT = 80
+BUCKET_STEP_PERCENT = 5
+BUCKET_STARVING_THROTTLE_RATE = 0.05
+# Basic tenants are paying customers; the controller never shrinks their bucket below this
+BASIC_TENANTS_BUCKET_FLOOR_PERCENT = 40
+PREMIUM_P99_TARGET_MS = 50
+
+# Offline benchmark suite (benchmarks/run_benchmarks.py)
+BENCHMARK_SEED = 42
+BENCHMARK_REGRESSION_THRESHOLD = 0.10
+BENCHMARK_THROTTLE_RATE_TOLERANCE = 0.01
+BENCHMARK_OFFERED_OPS_PER_SECOND = 100
+BENCHMARK_INGESTION_OPS_PER_SECOND = 50
+BENCHMARK_NUM_QUERIES = 5
+BENCHMARK_DOCS_TO_INSERT = 500
+BENCHMARK_INGESTION_DOCS = 2000
+
+# Hedged premium reads
+PREMIUM_HEDGED_READS = False
+# Regions for the hedge attempt; empty hedges through a second client in the same region
+HEDGE_PREFERRED_LOCATIONS = []
+HEDGE_DELAY_PERCENTILE = 95
+HEDGE_INITIAL_DELAY_MS = 50
+HEDGE_MIN_DELAY_MS = 5
+HEDGE_LATENCY_WINDOW = 200
+HEDGE_BUDGET_RATIO = 0.1
+HEDGE_BUDGET_BURST = 10
+HEDGE_DEADLINE_MS = 1000
+HEDGE_SIMULATION_SEED = 42
+HEDGE_SIMULATION_QUERIES = 20
+HEDGE_SIMULATION_CONCURRENCY = 10
@@ -0,0 +1,255 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import asynccontextmanager
+from configs.config import (
+    CONTAINER_THROUGHPUT,
+    INVENTORY_JOB_THROUGHPUT_BUCKET,
+    BASIC_TENANTS_THROUGHPUT_BUCKET,
+    INVENTORY_JOB_BUCKET_PERCENT,
+    BASIC_TENANTS_BUCKET_PERCENT,
+    BASIC_TENANTS_BUCKET_FLOOR_PERCENT,
+    BUCKET_CONTROLLER_WINDOW_SECONDS,
+    BUCKET_CONTROLLER_INTERVAL_SECONDS,
+    BUCKET_CHANGE_COOLDOWN_SECONDS,
+    BUCKET_MIN_CHANGE_PERCENT,
+    BUCKET_MIN_PERCENT,
+    BUCKET_MAX_PERCENT,
+    BUCKET_STEP_PERCENT,
+    PREMIUM_P99_TARGET_MS,
+    BUCKET_STARVING_THROTTLE_RATE,
+)
+from core.logging_config import get_logger
+from core.metrics import percentile
+
+logger = get_logger()
+
+# Requests sent without a throughput bucket (premium tenants) are sampled under this key
+UNBUCKETED = None
+
+# Percentages configured in the portal; the controller relaxes back to these without pressure
+CONFIGURED_BUCKET_PERCENTAGES = {
+    INVENTORY_JOB_THROUGHPUT_BUCKET: INVENTORY_JOB_BUCKET_PERCENT,
+    BASIC_TENANTS_THROUGHPUT_BUCKET: BASIC_TENANTS_BUCKET_PERCENT,
+}
+BUCKET_FLOOR_PERCENTAGES = {
+    BASIC_TENANTS_THROUGHPUT_BUCKET: BASIC_TENANTS_BUCKET_FLOOR_PERCENT,
+}
+# Highest priority first: grows first, gives RU back to premium last
+BUCKET_PRIORITIES = [BASIC_TENANTS_THROUGHPUT_BUCKET, INVENTORY_JOB_THROUGHPUT_BUCKET]
+
+
+class BucketUsageSampler:
+    # Sliding window of per-bucket RU consumption, 429s and latencies
+
+    def __init__(self, window_seconds=BUCKET_CONTROLLER_WINDOW_SECONDS, clock=time.monotonic):
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self.samples = {}
+
+    def record(self, bucket, ru_charge, requests=1, throttled=0, latency_ms=None, now=None):
+        now = self.clock() if now is None else now
+        window = self.samples.setdefault(bucket, deque())
+        window.append((now, ru_charge, requests, throttled, latency_ms))
+        self._evict(window, now)
+
+    def _evict(self, window, now):
+        while window and window[0][0] <= now - self.window_seconds:
+            window.popleft()
+
+    def _window(self, bucket, now=None):
+        now = self.clock() if now is None else now
+        window = self.samples.get(bucket, deque())
+        self._evict(window, now)
+        return window
+
+    def ru_per_second(self, bucket, now=None):
+        window = self._window(bucket, now)
+        return sum(s[1] for s in window) / self.window_seconds
+
+    def throttle_rate(self, bucket, now=None):
+        window = self._window(bucket, now)
+        requests = sum(s[2] for s in window)
+        return sum(s[3] for s in window) / requests if requests > 0 else 0.0
+
+    def latency_p99(self, bucket, now=None):
+        window = self._window(bucket, now)
+        return percentile([s[4] for s in window if s[4] is not None], 99)
+
+
+class BucketPolicy:
+    # Keep premium p99 under target, hand the remaining headroom to background buckets
+
+    def __init__(
+        self,
+        premium_p99_target_ms=PREMIUM_P99_TARGET_MS,
+        min_percent=BUCKET_MIN_PERCENT,
+        max_percent=BUCKET_MAX_PERCENT,
+        step_percent=BUCKET_STEP_PERCENT,
+        starving_throttle_rate=BUCKET_STARVING_THROTTLE_RATE,
+        grow_below_ratio=0.5,
+        container_throughput=CONTAINER_THROUGHPUT,
+        configured_percentages=None,
+        floor_percentages=None,
+        priorities=None,
+    ):
+        self.container_throughput = container_throughput
+        self.configured_percentages = (
+            CONFIGURED_BUCKET_PERCENTAGES if configured_percentages is None else configured_percentages
+        )
+        self.floor_percentages = BUCKET_FLOOR_PERCENTAGES if floor_percentages is None else floor_percentages
+        self.priorities = BUCKET_PRIORITIES if priorities is None else priorities
+        self.premium_p99_target_ms = premium_p99_target_ms
+        self.min_percent = min_percent
+        self.max_percent = max_percent
+        self.step_percent = step_percent
+        self.starving_throttle_rate = starving_throttle_rate
+        # Hysteresis band: shrink above the target, only grow well below it
+        self.grow_below_ratio = grow_below_ratio
+
+    def floor(self, bucket):
+        return max(self.min_percent, self.floor_percentages.get(bucket, 0))
+
+    def by_priority(self, buckets):
+        # Buckets without a priority rank below the known ones
+        rank = {bucket: i for i, bucket in enumerate(self.priorities)}
+        return sorted(buckets, key=lambda bucket: rank.get(bucket, len(rank)))
+
+    def compute(self, current, sampler, now=None):
+        premium_p99 = sampler.latency_p99(UNBUCKETED, now)
+        premium_throttled = sampler.throttle_rate(UNBUCKETED, now) > 0
+        # Capacity nobody is using right now, as a percentage of the container
+        used = sum(sampler.ru_per_second(bucket, now) for bucket in [UNBUCKETED, *current])
+        free_percent = max(0.0, 100 - used / self.container_throughput * 100)
+
+        premium_suffering = premium_throttled or (
+            premium_p99 is not None and premium_p99 > self.premium_p99_target_ms
+        )
+        premium_headroom = (
+            premium_p99 is None or premium_p99 < self.grow_below_ratio * self.premium_p99_target_ms
+        )
+
+        # Premium is suffering - pull RU back from the lowest-priority bucket above its floor
+        shrink_bucket = None
+        if premium_suffering:
+            shrink_bucket = next(
+                (b for b in reversed(self.by_priority(current)) if current[b] > self.floor(b)), None
+            )
+
+        targets = {}
+        for bucket in self.by_priority(current):
+            percent = current[bucket]
+            starving = sampler.throttle_rate(bucket, now) > self.starving_throttle_rate
+            if premium_suffering:
+                if bucket == shrink_bucket:
+                    percent -= self.step_percent
+            elif premium_headroom and starving:
+                # Premium has headroom and this bucket is starving - give it unused RU
+                grow = int(min(self.step_percent, free_percent))
+                percent += grow
+                free_percent -= grow
+            elif not starving and bucket in self.configured_percentages:
+                # No pressure either way - drift back toward the configured cap
+                configured = self.configured_percentages[bucket]
+                percent += max(-self.step_percent, min(self.step_percent, configured - percent))
+            targets[bucket] = max(self.floor(bucket), min(self.max_percent, percent))
+        return targets
+
+
+class ManagementBackend(ABC):
+    # Applies bucket percentages to the container; subclass for a real control plane
+
+    @abstractmethod
+    def get_bucket_percentages(self):
+        pass
+
+    @abstractmethod
+    def set_bucket_percentages(self, percentages):
+        pass
+
+
+class FakeManagementBackend(ManagementBackend):
+    # In-memory backend for local simulation and testing
+
+    def __init__(self, percentages):
+        self.percentages = dict(percentages)
+        self.history = []
+
+    def get_bucket_percentages(self):
+        return dict(self.percentages)
+
+    def set_bucket_percentages(self, percentages):
+        self.percentages.update(percentages)
+        self.history.append(dict(self.percentages))
+
+
+class BucketController:
+    def __init__(
+        self,
+        backend,
+        sampler,
+        policy=None,
+        min_change_percent=BUCKET_MIN_CHANGE_PERCENT,
+        cooldown_seconds=BUCKET_CHANGE_COOLDOWN_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.backend = backend
+        self.sampler = sampler
+        self.policy = policy or BucketPolicy()
+        self.min_change_percent = min_change_percent
+        self.cooldown_seconds = cooldown_seconds
+        self.clock = clock
+        self.last_change = None
+
+    def evaluate(self, now=None):
+        now = self.clock() if now is None else now
+        # Rate limit: at most one change per cooldown period
+        if self.last_change is not None and now - self.last_change < self.cooldown_seconds:
+            return None
+
+        current = self.backend.get_bucket_percentages()
+        targets = self.policy.compute(current, self.sampler, now)
+        # Hysteresis: ignore changes too small to be worth a control-plane call
+        changes = {
+            bucket: percent
+            for bucket, percent in targets.items()
+            if abs(percent - current[bucket]) >= self.min_change_percent
+        }
+        if not changes:
+            return None
+
+        self.backend.set_bucket_percentages(changes)
+        self.last_change = now
+        logger.debug(f"[Bucket Controller] Updated bucket percentages: {changes}")
+        return changes
+
+    async def run(self, stop_event, interval_seconds=BUCKET_CONTROLLER_INTERVAL_SECONDS):
+        while not stop_event.is_set():
+            try:
+                changes = self.evaluate()
+                if changes:
+                    logger.info(f"[Bucket Controller] Applied bucket percentages: {changes}")
+            except Exception as e:
+                logger.error(f"[Bucket Controller] Failed to update buckets: {str(e)}")
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+
+@asynccontextmanager
+async def dry_run_bucket_controller(interval_seconds=BUCKET_CONTROLLER_INTERVAL_SECONDS):
+    # The SDK cannot change bucket percentages, so live runs feed the sampler from
+    # real responses and only log the percentages the controller would apply
+    backend = FakeManagementBackend(CONFIGURED_BUCKET_PERCENTAGES)
+    sampler = BucketUsageSampler()
+    controller = BucketController(backend, sampler)
+    stop_event = asyncio.Event()
+    task = asyncio.create_task(controller.run(stop_event, interval_seconds))
+    try:
+        yield sampler
+    finally:
+        stop_event.set()
+        await task
+        logger.info(f"[Bucket Controller] Dry run - recommended bucket percentages: {backend.get_bucket_percentages()} (configured: {CONFIGURED_BUCKET_PERCENTAGES})")
@@ -2,11 +2,12 @@ from azure.cosmos.aio import CosmosClient
 from configs.config import COSMOS_DB_URI, COSMOS_DB_KEY
 
 
-def create_cosmos_client():
+def create_cosmos_client(preferred_locations=None):
     return CosmosClient(
         COSMOS_DB_URI,
         COSMOS_DB_KEY,
         retry_total=1,  # maximum number of retries - for demo purposes
+        preferred_locations=preferred_locations or [],
     )
 
 
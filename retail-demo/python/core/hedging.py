@@ -0,0 +1,121 @@
+import asyncio
+import math
+import time
+from collections import deque
+from configs.config import (
+    HEDGE_DELAY_PERCENTILE,
+    HEDGE_INITIAL_DELAY_MS,
+    HEDGE_MIN_DELAY_MS,
+    HEDGE_LATENCY_WINDOW,
+    HEDGE_BUDGET_RATIO,
+    HEDGE_BUDGET_BURST,
+    HEDGE_DEADLINE_MS,
+)
+from core.metrics import percentile
+
+
+class HedgeBudget:
+    # Each request earns `ratio` hedge tokens, so hedging adds at most ratio extra load
+
+    def __init__(self, ratio=HEDGE_BUDGET_RATIO, burst=HEDGE_BUDGET_BURST):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = 0.0
+
+    def on_request(self):
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def try_acquire(self):
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class LatencyTracker:
+    # Hedge delay follows a percentile of recently observed read latencies
+
+    def __init__(
+        self,
+        delay_percentile=HEDGE_DELAY_PERCENTILE,
+        window=HEDGE_LATENCY_WINDOW,
+        initial_delay_ms=HEDGE_INITIAL_DELAY_MS,
+        min_delay_ms=HEDGE_MIN_DELAY_MS,
+    ):
+        self.delay_percentile = delay_percentile
+        self.initial_delay_ms = initial_delay_ms
+        self.min_delay_ms = min_delay_ms
+        self.samples = deque(maxlen=window)
+
+    def record(self, latency_ms):
+        self.samples.append(latency_ms)
+
+    def hedge_delay_ms(self):
+        # Not enough samples for a meaningful percentile yet
+        if len(self.samples) < self.samples.maxlen // 10:
+            return self.initial_delay_ms
+        return max(self.min_delay_ms, percentile(self.samples, self.delay_percentile))
+
+
+class HedgedReader:
+    # Runs a read on the primary container and, if it is slow, a second attempt on the next one
+
+    def __init__(self, containers, deadline_ms=HEDGE_DEADLINE_MS, budget=None, tracker=None, clock=time.monotonic):
+        self.containers = containers
+        self.deadline_ms = deadline_ms
+        self.budget = budget or HedgeBudget()
+        self.tracker = tracker or LatencyTracker()
+        self.clock = clock
+        self.stats = {"requests": 0, "hedged": 0, "hedge_wins": 0, "deadline_exceeded": 0}
+
+    async def read(self, operation):
+        # operation(container) returns an awaitable; the first successful result wins
+        self.stats["requests"] += 1
+        self.budget.on_request()
+        start = self.clock()
+        deadline = start + self.deadline_ms / 1000
+        hedge_at = start + self.tracker.hedge_delay_ms() / 1000
+
+        primary = asyncio.ensure_future(operation(self.containers[0]))
+        hedge = None
+        pending = {primary}
+        error = None
+        try:
+            while pending:
+                now = self.clock()
+                if now >= deadline:
+                    break
+                timeout = deadline - now
+                if hedge is None:
+                    timeout = min(timeout, max(0, hedge_at - now))
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self.tracker.record((self.clock() - start) * 1000)
+                        if task is hedge:
+                            self.stats["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+
+                if hedge is None and pending and self.clock() >= hedge_at:
+                    if not self.budget.try_acquire():
+                        # Out of budget - let the primary run to completion or deadline
+                        hedge_at = math.inf
+                        continue
+                    hedge = asyncio.ensure_future(
+                        operation(self.containers[1 % len(self.containers)])
+                    )
+                    pending.add(hedge)
+                    self.stats["hedged"] += 1
+
+            if error is not None and not pending:
+                raise error
+            self.stats["deadline_exceeded"] += 1
+            raise asyncio.TimeoutError(f"Read exceeded deadline of {self.deadline_ms}ms")
+        finally:
+            # Cancel whichever attempt lost (or both, on deadline)
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import math
+import re
+from azure.cosmos.exceptions import CosmosHttpResponseError
+from configs.config import CONTAINER_THROUGHPUT
+from core.metrics import percentile
+
+# Deterministic RU/latency model standing in for a Cosmos DB container (offline benchmarks)
+QUERY_BASE_RU = 2.8
+QUERY_RU_PER_ITEM = 0.4
+WRITE_BASE_RU = 5.7
+WRITE_RU_PER_KB = 1.0
+QUERY_BASE_LATENCY_MS = 4.0
+WRITE_BASE_LATENCY_MS = 6.0
+LATENCY_MS_PER_RU = 0.2
+THROTTLED_LATENCY_MS = 1.0
+
+
+class LocalThroughputModel:
+    # Virtual clock: every offered_ops_per_second arrivals make up one second of RU budget
+
+    def __init__(self, offered_ops_per_second, throughput=CONTAINER_THROUGHPUT, bucket_percentages=None):
+        self.offered_ops_per_second = offered_ops_per_second
+        self.throughput = throughput
+        self.bucket_percentages = dict(bucket_percentages or {})
+        self.arrivals = 0
+        self.second = 0
+        self.consumed = 0.0
+        self.bucket_consumed = {}
+        self.records = []
+
+    def charge(self, ru, throughput_bucket, base_latency_ms):
+        second = self.arrivals // self.offered_ops_per_second
+        self.arrivals += 1
+        if second != self.second:
+            self.second = second
+            self.consumed = 0.0
+            self.bucket_consumed = {}
+
+        bucket_limit = (
+            self.throughput * self.bucket_percentages[throughput_bucket] / 100
+            if throughput_bucket in self.bucket_percentages
+            else self.throughput
+        )
+        bucket_used = self.bucket_consumed.get(throughput_bucket, 0.0)
+        if self.consumed + ru > self.throughput or bucket_used + ru > bucket_limit:
+            self.records.append((True, THROTTLED_LATENCY_MS, 0.0))
+            raise CosmosHttpResponseError(
+                status_code=429, message="Request rate is large (local throughput model)"
+            )
+
+        utilization = self.consumed / self.throughput
+        self.consumed += ru
+        self.bucket_consumed[throughput_bucket] = bucket_used + ru
+        latency_ms = (base_latency_ms + ru * LATENCY_MS_PER_RU) / (1 - min(utilization, 0.9))
+        self.records.append((False, latency_ms, ru))
+        return latency_ms
+
+    def summary(self):
+        duration = max(1, math.ceil(self.arrivals / self.offered_ops_per_second))
+        completed = [r for r in self.records if not r[0]]
+        throttled = len(self.records) - len(completed)
+        p99 = percentile([r[1] for r in completed], 99)
+        return {
+            "throughput": round(len(completed) / duration, 3),
+            "p99_latency_ms": round(p99, 3) if p99 is not None else None,
+            "throttle_rate": round(throttled / len(self.records), 4) if self.records else 0.0,
+            "ru_consumed": round(sum(r[2] for r in completed), 3),
+        }
+
+
+class LocalQueryIterable:
+    # Lazily charges one page per fetch, like the SDK's query iterator
+
+    def __init__(self, container, filters, max_item_count, throughput_bucket, response_hook=None):
+        self.container = container
+        self.filters = filters
+        self.max_item_count = max_item_count or 100
+        self.throughput_bucket = throughput_bucket
+        self.response_hook = response_hook
+        self.matches = None
+        self.page = []
+        self.fetched = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.matches is None:
+            self.matches = self.container.documents.find(self.filters)
+        if not self.page:
+            if not self.matches and self.fetched:
+                raise StopAsyncIteration
+            # An empty result still costs a round trip and RU
+            self.page = self.matches[: self.max_item_count]
+            self.matches = self.matches[self.max_item_count :]
+            self.fetched = True
+            ru = QUERY_BASE_RU + QUERY_RU_PER_ITEM * len(self.page)
+            latency_ms = self.container.model.charge(ru, self.throughput_bucket, QUERY_BASE_LATENCY_MS)
+            await self.container.respond(latency_ms)
+            if self.response_hook is not None:
+                self.response_hook({"x-ms-request-charge": str(ru)}, {"Documents": list(self.page)})
+            if not self.page:
+                raise StopAsyncIteration
+        return self.page.pop(0)
+
+
+class LocalDocumentStore:
+    # Documents keyed by (tenant, id); share one store between containers that see the same data
+
+    def __init__(self, docs=()):
+        self.documents = {}
+        self.indexes = {}
+        for doc in docs:
+            self.upsert(doc)
+
+    def __len__(self):
+        return len(self.documents)
+
+    def upsert(self, doc):
+        self.documents[(doc["tenant"], doc["id"])] = dict(doc)
+        # Indexes live with the documents, so every container sharing them sees the write
+        self.indexes.clear()
+
+    def find(self, filters):
+        # One index per set of filtered fields, built on first use
+        fields = tuple(sorted(filters))
+        if fields not in self.indexes:
+            index = {}
+            for doc in self.documents.values():
+                index.setdefault(tuple(doc.get(field) for field in fields), []).append(doc)
+            self.indexes[fields] = index
+        return list(self.indexes[fields].get(tuple(filters[field] for field in fields), []))
+
+
+class LocalContainer:
+    # Async stand-in for a ContainerProxy; pass the same LocalDocumentStore to share documents.
+    # With simulate_latency, responses take the modeled latency in real time, and a
+    # seeded rng makes some of them stall (a slow replica) for slow_latency_ms.
+
+    def __init__(
+        self,
+        model,
+        throughput_bucket=None,
+        documents=None,
+        simulate_latency=False,
+        rng=None,
+        slow_probability=0.0,
+        slow_latency_ms=0.0,
+    ):
+        self.model = model
+        self.throughput_bucket = throughput_bucket
+        self.documents = documents if documents is not None else LocalDocumentStore()
+        self.simulate_latency = simulate_latency
+        self.rng = rng
+        self.slow_probability = slow_probability
+        self.slow_latency_ms = slow_latency_ms
+
+    async def respond(self, latency_ms):
+        if not self.simulate_latency:
+            return
+        if self.rng is not None and self.rng.random() < self.slow_probability:
+            latency_ms += self.slow_latency_ms
+        await asyncio.sleep(latency_ms / 1000)
+
+    def query_items(self, query, parameters=None, max_item_count=None, throughput_bucket=None, response_hook=None, **kwargs):
+        # Supports equality filters of the form "c.<field> = @<name>"
+        values = {p["name"]: p["value"] for p in parameters or []}
+        filters = {
+            field: values[name] for field, name in re.findall(r"c\.(\w+)\s*=\s*(@\w+)", query)
+        }
+        bucket = throughput_bucket if throughput_bucket is not None else self.throughput_bucket
+        return LocalQueryIterable(self, filters, max_item_count, bucket, response_hook)
+
+    def _upsert(self, body, response_hook=None):
+        ru = WRITE_BASE_RU + len(json.dumps(body)) / 1024 * WRITE_RU_PER_KB
+        latency_ms = self.model.charge(ru, self.throughput_bucket, WRITE_BASE_LATENCY_MS)
+        self.documents.upsert(body)
+        if response_hook is not None:
+            response_hook({"x-ms-request-charge": str(ru)}, body)
+        return latency_ms
+
+    async def upsert_item(self, body, response_hook=None, **kwargs):
+        await self.respond(self._upsert(body, response_hook))
+        return body
+
+
+class LocalSyncContainer(LocalContainer):
+    # Sync stand-in for azure.cosmos ContainerProxy (used by data ingestion)
+
+    def upsert_item(self, body, response_hook=None, **kwargs):
+        self._upsert(body, response_hook)
+        return body
@@ -0,0 +1,9 @@
+import math
+
+
+def percentile(values, pct):
+    # Nearest-rank percentile, pct in [0, 100]; None for no samples
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))]
@@ -1,7 +1,11 @@
 import asyncio
+from contextlib import nullcontext
 from scripts.setup import setup_container
 from scenarios.simulate_searches import simulate_product_searches
 from scenarios.simulate_inventory_job import execute_bulk_inventory_update
+from scenarios.simulate_bucket_controller import simulate_bucket_controller
+from scenarios.simulate_hedged_reads import simulate_hedged_reads
+from core.bucket_controller import dry_run_bucket_controller
 from configs.config import *
 from core.logging_config import get_logger
 
@@ -15,16 +19,30 @@ async def main():
     try:
         scenario = int(
             input(
-                "Select simulation scenario (1 or 2):\n"
+                "Select simulation scenario (1, 2, 3 or 4):\n"
                 "1: Multi-tenant product search workload\n"
                 "2: Concurrent inventory updates with product searches\n"
+                "3: Adaptive bucket controller vs static caps (local simulation)\n"
+                "4: Hedged premium reads (local simulation)\n"
             )
         )
-        if scenario not in [1, 2]:
-            logger.error("Invalid scenario. Must be 1 or 2.")
+        if scenario not in [1, 2, 3, 4]:
+            logger.error("Invalid scenario. Must be 1, 2, 3 or 4.")
             return
     except ValueError:
-        logger.error("Invalid input. Please enter a number (1 or 2).")
+        logger.error("Invalid input. Please enter a number (1, 2, 3 or 4).")
+        return
+
+    if scenario == 3:
+        # Runs against a local model of the container, no Cosmos DB account needed
+        logger.info("--- Running Scenario 3: Adaptive bucket controller ---")
+        simulate_bucket_controller()
+        return
+
+    if scenario == 4:
+        # Runs against local replicas, no Cosmos DB account needed
+        logger.info("--- Running Scenario 4: Hedged premium reads ---")
+        await simulate_hedged_reads()
         return
 
     try:
@@ -53,24 +71,30 @@ async def main():
     else:
         logger.info("Skipping container setup")
 
-    await run_simulation(use_throughput_buckets, scenario)
+    # Without buckets there is nothing for the controller to tune
+    use_bucket_controller = ADAPTIVE_BUCKET_CONTROLLER and use_throughput_buckets
+    async with (dry_run_bucket_controller() if use_bucket_controller else nullcontext()) as sampler:
+        await run_simulation(use_throughput_buckets, scenario, sampler)
 
 
-async def run_simulation(use_throughput_buckets, scenario):
+async def run_simulation(use_throughput_buckets, scenario, sampler=None):
     # Run simulation based on scenario
     if scenario == 1:
         logger.info("--- Running Scenario 1: Multi-tenant workload ---")
         logger.info(f"Throughput buckets enabled: {use_throughput_buckets}")
+        logger.info(f"Hedged premium reads enabled: {PREMIUM_HEDGED_READS}")
+        logger.info(f"Adaptive bucket controller (dry run): {sampler is not None}")
 
         num_queries = NUM_QUERIES
         throughput_bucket = (
             BASIC_TENANTS_THROUGHPUT_BUCKET if use_throughput_buckets else None
         )
-        await simulate_product_searches(throughput_bucket, num_queries)
+        await simulate_product_searches(throughput_bucket, num_queries, PREMIUM_HEDGED_READS, sampler)
 
     elif scenario == 2:
         logger.info("--- Running Scenario 2: Background job for inventory update ---")
         logger.info(f"Throughput buckets enabled: {use_throughput_buckets}")
+        logger.info(f"Adaptive bucket controller (dry run): {sampler is not None}")
 
         num_queries = NUM_QUERIES_INVENTORY_JOB
         throughput_bucket = (
@@ -81,8 +105,9 @@ async def run_simulation(use_throughput_buckets, scenario):
                 throughput_bucket,
                 docs_to_insert=INVENTORY_JOB_DOCS_TO_INSERT,
                 max_concurrency=INVENTORY_JOB_CONCURRENCY,
+                sampler=sampler,
             ),
-            simulate_product_searches(num_queries=num_queries),
+            simulate_product_searches(num_queries=num_queries, hedged_reads=PREMIUM_HEDGED_READS, sampler=sampler),
         )
 
 
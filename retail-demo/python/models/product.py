@@ -17,8 +17,8 @@ PRODUCT_TYPES = [
 ]
 
 
-def get_random_product_type():
-    return random.choice(PRODUCT_TYPES) if PRODUCT_TYPES else None
+def get_random_product_type(rng=random):
+    return rng.choice(PRODUCT_TYPES) if PRODUCT_TYPES else None
 
 
 def get_all_product_types():
@@ -37,13 +37,14 @@ class Product:
         self.sku = sku
 
     @staticmethod
-    def generate_product(tenant=None, sku=None):
-        id = str(random.randint(100000, 1000000))
-        Type = get_random_product_type()
-        Brand = random.choice(
+    def generate_product(tenant=None, sku=None, rng=random):
+        # Pass a seeded random.Random as rng for reproducible products
+        id = str(rng.randint(100000, 1000000))
+        Type = get_random_product_type(rng)
+        Brand = rng.choice(
             ["UrbanX", "Acme", "Globex", "Soylent", "Initech", "Umbrella"]
         )
-        Name = random.choice(
+        Name = rng.choice(
             [
                 "Plant Rise Accessories",
                 "Super Gadget",
@@ -54,11 +55,11 @@ class Product:
             ]
         )
         Description = " ".join(
-            random.choices(string.ascii_letters + " ", k=100)
+            rng.choices(string.ascii_letters + " ", k=100)
         ).strip()
-        Price = round(random.uniform(10, 500), 2)
-        tenant = tenant if tenant is not None else f"tenant_{random.randint(1, 10)}"
-        sku = sku if sku is not None else random.choice(["basic", "premium"])
+        Price = round(rng.uniform(10, 500), 2)
+        tenant = tenant if tenant is not None else f"tenant_{rng.randint(1, 10)}"
+        sku = sku if sku is not None else rng.choice(["basic", "premium"])
         return Product(id, Type, Brand, Name, Description, Price, tenant, sku)
 
     def to_dict(self):
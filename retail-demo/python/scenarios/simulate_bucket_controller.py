@@ -0,0 +1,133 @@
+import math
+from configs.config import (
+    CONTAINER_THROUGHPUT,
+    INVENTORY_JOB_THROUGHPUT_BUCKET,
+    BASIC_TENANTS_THROUGHPUT_BUCKET,
+    INVENTORY_JOB_BUCKET_PERCENT,
+    BASIC_TENANTS_BUCKET_PERCENT,
+    BUCKET_CONTROLLER_INTERVAL_SECONDS,
+    PREMIUM_P99_TARGET_MS,
+)
+from core.bucket_controller import (
+    UNBUCKETED,
+    BucketController,
+    BucketUsageSampler,
+    FakeManagementBackend,
+)
+from core.logging_config import get_logger
+
+logger = get_logger()
+
+# Local model of one day of traffic against the container (no Cosmos DB calls)
+SECONDS_PER_DAY = 24 * 60 * 60
+TICK_SECONDS = 10
+RU_PER_REQUEST = 5
+BASE_LATENCY_MS = 5
+
+
+def daytime_load(t):
+    # 0 at midnight, 1 at midday
+    return (1 - math.cos(2 * math.pi * t / SECONDS_PER_DAY)) / 2
+
+
+def demand_at(t):
+    # Offered load in RU/s per bucket; the inventory job always wants more than it gets
+    day = daytime_load(t)
+    return {
+        UNBUCKETED: CONTAINER_THROUGHPUT * (0.15 + 0.55 * day),
+        BASIC_TENANTS_THROUGHPUT_BUCKET: CONTAINER_THROUGHPUT * (0.10 + 0.40 * day),
+        INVENTORY_JOB_THROUGHPUT_BUCKET: CONTAINER_THROUGHPUT * 0.60,
+    }
+
+
+def serve_tick(demand, percentages):
+    # Bucket caps apply first, then the container limit throttles everyone proportionally
+    admitted = {
+        bucket: rus if bucket is UNBUCKETED
+        else min(rus, CONTAINER_THROUGHPUT * percentages[bucket] / 100)
+        for bucket, rus in demand.items()
+    }
+    total = sum(admitted.values())
+    scale = min(1.0, CONTAINER_THROUGHPUT / total) if total > 0 else 1.0
+    served = {bucket: rus * scale for bucket, rus in admitted.items()}
+    utilization = sum(served.values()) / CONTAINER_THROUGHPUT
+    latency_ms = BASE_LATENCY_MS / max(1 - utilization, 0.05)
+    return served, latency_ms
+
+
+def run_day(controller=None, backend=None, sampler=None):
+    percentages = {
+        INVENTORY_JOB_THROUGHPUT_BUCKET: INVENTORY_JOB_BUCKET_PERCENT,
+        BASIC_TENANTS_THROUGHPUT_BUCKET: BASIC_TENANTS_BUCKET_PERCENT,
+    }
+    stats = {
+        "goodput": 0.0,
+        "bucket_goodput": {bucket: 0.0 for bucket in demand_at(0)},
+        "premium_throttled": 0.0,
+        "slo_violations": 0,
+        "ticks": 0,
+    }
+    next_evaluation = 0
+
+    for t in range(0, SECONDS_PER_DAY, TICK_SECONDS):
+        if backend is not None:
+            percentages = backend.get_bucket_percentages()
+        demand = demand_at(t)
+        served, latency_ms = serve_tick(demand, percentages)
+
+        for bucket, rus in demand.items():
+            requests = rus * TICK_SECONDS / RU_PER_REQUEST
+            throttled = (rus - served[bucket]) * TICK_SECONDS / RU_PER_REQUEST
+            if sampler is not None:
+                sampler.record(bucket, served[bucket] * TICK_SECONDS, requests, throttled, latency_ms, now=t)
+
+        stats["goodput"] += sum(served.values()) * TICK_SECONDS
+        for bucket, rus in served.items():
+            stats["bucket_goodput"][bucket] += rus * TICK_SECONDS
+        stats["premium_throttled"] += (demand[UNBUCKETED] - served[UNBUCKETED]) * TICK_SECONDS
+        stats["slo_violations"] += latency_ms > PREMIUM_P99_TARGET_MS
+        stats["ticks"] += 1
+
+        if controller is not None and t >= next_evaluation:
+            controller.evaluate(now=t)
+            next_evaluation = t + BUCKET_CONTROLLER_INTERVAL_SECONDS
+
+    stats["final_percentages"] = percentages
+    return stats
+
+
+def log_day_stats(label, stats):
+    premium_goodput = stats["bucket_goodput"][UNBUCKETED]
+    total_premium = premium_goodput + stats["premium_throttled"]
+    premium_throttled_percentage = (
+        stats["premium_throttled"] * 1.0 / total_premium * 100 if total_premium > 0 else 0
+    )
+    slo_percentage = stats["slo_violations"] * 1.0 / stats["ticks"] * 100
+    logger.info(f"  [{label}]:")
+    logger.info(f"    - Goodput: {stats['goodput'] / SECONDS_PER_DAY:.1f} RU/s average")
+    logger.info(f"    - Premium goodput: {premium_goodput / SECONDS_PER_DAY:.1f} RU/s average")
+    logger.info(f"    - Basic tenant goodput (bucket {BASIC_TENANTS_THROUGHPUT_BUCKET}): {stats['bucket_goodput'][BASIC_TENANTS_THROUGHPUT_BUCKET] / SECONDS_PER_DAY:.1f} RU/s average")
+    logger.info(f"    - Inventory job goodput (bucket {INVENTORY_JOB_THROUGHPUT_BUCKET}): {stats['bucket_goodput'][INVENTORY_JOB_THROUGHPUT_BUCKET] / SECONDS_PER_DAY:.1f} RU/s average")
+    logger.info(f"    - Premium throttling rate: {premium_throttled_percentage:.2f}%")
+    logger.info(f"    - Time above premium p99 target ({PREMIUM_P99_TARGET_MS}ms): {slo_percentage:.2f}%")
+    logger.info(f"    - Bucket percentages at end of day: {stats['final_percentages']}")
+
+
+def simulate_bucket_controller():
+    logger.info("[Bucket Controller] Simulating one day of traffic with static and adaptive bucket caps")
+    static_stats = run_day()
+
+    backend = FakeManagementBackend({
+        INVENTORY_JOB_THROUGHPUT_BUCKET: INVENTORY_JOB_BUCKET_PERCENT,
+        BASIC_TENANTS_THROUGHPUT_BUCKET: BASIC_TENANTS_BUCKET_PERCENT,
+    })
+    sampler = BucketUsageSampler()
+    controller = BucketController(backend, sampler)
+    adaptive_stats = run_day(controller, backend, sampler)
+
+    log_day_stats("Static bucket caps", static_stats)
+    logger.info(f"")
+    log_day_stats("Adaptive bucket caps", adaptive_stats)
+    logger.info(f"")
+    logger.info(f"[Bucket Controller] Bucket changes applied: {len(backend.history)}")
+    return static_stats, adaptive_stats
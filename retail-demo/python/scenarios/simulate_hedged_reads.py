@@ -0,0 +1,81 @@
+import asyncio
+import itertools
+import random
+import time
+from configs.config import (
+    HEDGE_SIMULATION_SEED,
+    HEDGE_SIMULATION_QUERIES,
+    HEDGE_SIMULATION_CONCURRENCY,
+)
+from core.hedging import HedgedReader
+from core.local_backend import LocalContainer, LocalDocumentStore, LocalThroughputModel
+from core.logging_config import get_logger
+from core.metrics import percentile
+from models.product import get_all_product_types
+from models.tenant_sku_mapping import get_premium_sku_tenants
+from scenarios.simulate_searches import execute_query
+from scripts.data_ingestion import load_products
+
+logger = get_logger()
+
+# Local replicas: mostly fast, occasionally stalled (e.g. behind a noisy neighbour)
+OFFERED_OPS_PER_SECOND = 50
+SLOW_REPLICA_PROBABILITY = 0.02
+SLOW_REPLICA_LATENCY_MS = 250
+
+
+async def run_premium_searches(documents, hedged, seed):
+    model = LocalThroughputModel(OFFERED_OPS_PER_SECOND)
+    # Two replicas (or regions) of the same container, each with its own stall pattern
+    replicas = [
+        LocalContainer(
+            model,
+            documents=documents,
+            simulate_latency=True,
+            rng=random.Random(seed + i),
+            slow_probability=SLOW_REPLICA_PROBABILITY,
+            slow_latency_ms=SLOW_REPLICA_LATENCY_MS,
+        )
+        for i in range(2)
+    ]
+    hedged_reader = HedgedReader(replicas) if hedged else None
+    semaphore = asyncio.Semaphore(HEDGE_SIMULATION_CONCURRENCY)
+    latencies = []
+
+    async def timed_query(tenant, product_type):
+        async with semaphore:
+            start = time.perf_counter()
+            result = await execute_query(replicas[0], tenant, True, None, product_type, hedged_reader)
+            latencies.append((time.perf_counter() - start) * 1000)
+            return result
+
+    combos = itertools.product(
+        get_premium_sku_tenants(), get_all_product_types(), range(HEDGE_SIMULATION_QUERIES)
+    )
+    await asyncio.gather(*[timed_query(tenant, product_type) for (tenant, product_type, i) in combos])
+    return latencies, model.summary()["ru_consumed"], hedged_reader
+
+
+async def simulate_hedged_reads(seed=HEDGE_SIMULATION_SEED):
+    logger.info("[Hedged Reads] Running premium searches against local replicas with and without hedging")
+    documents = LocalDocumentStore(load_products())
+    baseline_latencies, baseline_ru, _ = await run_premium_searches(documents, False, seed)
+    hedged_latencies, hedged_ru, hedged_reader = await run_premium_searches(documents, True, seed)
+
+    for label, latencies, ru in [
+        ("Without hedging", baseline_latencies, baseline_ru),
+        ("With hedging", hedged_latencies, hedged_ru),
+    ]:
+        logger.info(f"  [{label}]:")
+        logger.info(f"    - p50 latency: {percentile(latencies, 50):.1f}ms")
+        logger.info(f"    - p99 latency: {percentile(latencies, 99):.1f}ms")
+        logger.info(f"    - RU consumed: {ru:.1f}")
+
+    p99_improvement = (
+        1 - percentile(hedged_latencies, 99) / percentile(baseline_latencies, 99)
+    ) * 100
+    extra_ru = (hedged_ru / baseline_ru - 1) * 100 if baseline_ru > 0 else 0
+    stats = hedged_reader.stats
+    logger.info(f"")
+    logger.info(f"[Hedged Reads] Hedged {stats['hedged']} of {stats['requests']} queries, hedge won {stats['hedge_wins']}, deadline exceeded {stats['deadline_exceeded']}")
+    logger.info(f"[Hedged Reads] p99 latency improved by {p99_improvement:.1f}% for {extra_ru:.1f}% extra RU")
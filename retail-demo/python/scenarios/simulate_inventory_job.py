@@ -9,13 +9,24 @@ from azure.cosmos.exceptions import CosmosHttpResponseError
 logger = get_logger()
 
 
-async def insert_product(container, product, stats, lock):
+async def insert_product(container, product, stats, lock, sampler=None, throughput_bucket=None):
+    request_charge = 0.0
+    throttled = 0
+    latency_ms = None
+
+    def record_charge(headers, result):
+        nonlocal request_charge
+        request_charge = float(headers.get("x-ms-request-charge", 0))
+
+    start = time.perf_counter()
     try:
-        await container.upsert_item(body=product.to_dict())
+        await container.upsert_item(body=product.to_dict(), response_hook=record_charge)
+        latency_ms = (time.perf_counter() - start) * 1000
         async with lock:
             stats["inserted"] += 1
     except CosmosHttpResponseError as e:
         if hasattr(e, "status_code") and e.status_code == 429:
+            throttled = 1
             async with lock:
                 stats["throttled"] += 1
                 logger.debug(
@@ -25,9 +36,25 @@ async def insert_product(container, product, stats, lock):
             logger.error(f"[Inventory Job] HTTP Error {e.status_code}: Failed to insert product {product.id} (SKU: {product.sku}, Tenant: {product.tenant}) - {str(e)}")
     except Exception as e:
         logger.error(f"[Inventory Job] Unexpected error inserting product {product.id}: {str(e)}")
+    if sampler is not None:
+        sampler.record(throughput_bucket, request_charge, 1, throttled, latency_ms)
+
+
+async def upsert_products(container, products, max_concurrency=30, sampler=None, throughput_bucket=None):
+    semaphore = asyncio.Semaphore(max_concurrency)
+    stats = {"inserted": 0, "throttled": 0}
+    lock = asyncio.Lock()
 
+    async def sem_insert(product):
+        async with semaphore:
+            await insert_product(container, product, stats, lock, sampler, throughput_bucket)
 
-async def execute_bulk_inventory_update(throughputBucket=None, docs_to_insert=1000, max_concurrency=30):
+    tasks = [sem_insert(product) for product in products]
+    await asyncio.gather(*tasks)
+    return stats
+
+
+async def execute_bulk_inventory_update(throughputBucket=None, docs_to_insert=1000, max_concurrency=30, sampler=None):
     async with create_cosmos_client_with_bucket(throughputBucket) as client:
         container = client.get_database_client(DATABASE_NAME).get_container_client(
             CONTAINER_NAME
@@ -37,16 +64,7 @@ async def execute_bulk_inventory_update(throughputBucket=None, docs_to_insert=10
         logger.info(f"[Inventory Job] Configuration - Documents to insert: {docs_to_insert}, Max concurrency: {max_concurrency}")
         start = time.time()
         products = [Product.generate_product() for _ in range(docs_to_insert)]
-        semaphore = asyncio.Semaphore(max_concurrency)
-        stats = {"inserted": 0, "throttled": 0}
-        lock = asyncio.Lock()
-
-        async def sem_insert(product):
-            async with semaphore:
-                await insert_product(container, product, stats, lock)
-
-        tasks = [sem_insert(product) for product in products]
-        await asyncio.gather(*tasks)
+        stats = await upsert_products(container, products, max_concurrency, sampler, throughputBucket)
         
         execution_time = time.time() - start
         logger.info(f"[Inventory Job] Completed bulk upload in {execution_time:.2f} seconds")
@@ -1,21 +1,32 @@
 import asyncio
 import time
 import itertools
+from contextlib import AsyncExitStack
 from azure.cosmos.exceptions import CosmosHttpResponseError
-from configs.config import DATABASE_NAME, CONTAINER_NAME
+from configs.config import DATABASE_NAME, CONTAINER_NAME, HEDGE_PREFERRED_LOCATIONS
 from models.product import get_all_product_types
 from models.tenant_sku_mapping import get_basic_sku_tenants, get_premium_sku_tenants
 from core.client_factory import create_cosmos_client
+from core.hedging import HedgedReader
 from core.logging_config import get_logger
+from core.metrics import percentile
 
 logger = get_logger()
 
 
-async def execute_query(container, tenant, is_premium, throughput_bucket, product_type):
+async def execute_query(container, tenant, is_premium, throughput_bucket, product_type, hedged_reader=None, sampler=None):
     success = 0
     throttled = 0
-    try:
-        items = container.query_items(
+    deadline_exceeded = 0
+    latency_ms = None
+    # RU of every attempt that got a response, hedges included
+    request_charges = []
+
+    def record_charge(headers, result):
+        request_charges.append(float(headers.get("x-ms-request-charge", 0)))
+
+    async def fetch_first_page(target):
+        items = target.query_items(
             query="SELECT * FROM c WHERE c.tenant = @tenant AND c.Type = @type",
             parameters=[
                 {"name": "@tenant", "value": tenant},
@@ -23,11 +34,28 @@ async def execute_query(container, tenant, is_premium, throughput_bucket, produc
             ],
             max_item_count=10,
             throughput_bucket=throughput_bucket,
+            response_hook=record_charge,
+        )
+        # An empty page is still a response, not a failure
+        try:
+            return await items.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    start = time.perf_counter()
+    try:
+        if hedged_reader is not None:
+            item = await hedged_reader.read(fetch_first_page)
+        else:
+            item = await fetch_first_page(container)
+        latency_ms = (time.perf_counter() - start) * 1000
+        if item is not None:
+            success += 1
+    except asyncio.TimeoutError:
+        deadline_exceeded += 1
+        logger.debug(
+            f"[Read Simulation] Deadline exceeded: {'Premium' if is_premium else 'Basic'} tenant {tenant}, product type {product_type}"
         )
-        await items.__anext__()
-        success += 1
-    except StopAsyncIteration:
-        pass
     except CosmosHttpResponseError as e:
         if e.status_code == 429:
             throttled += 1
@@ -40,19 +68,53 @@ async def execute_query(container, tenant, is_premium, throughput_bucket, produc
             )
     except Exception as e:
         logger.error(f"Error Tenant={tenant}: {str(e)}")
+    if sampler is not None:
+        # Feeds the adaptive bucket controller; premium queries are sampled as unbucketed
+        sampler.record(throughput_bucket, sum(request_charges), 1, throttled, latency_ms)
     return {
         "tenant": tenant,
         "is_premium": is_premium,
         "throttled": throttled,
         "success": success,
+        "deadline_exceeded": deadline_exceeded,
+        "latency_ms": latency_ms,
+        "request_charge": sum(request_charges),
     }
 
 
-async def simulate_product_searches(throughput_bucket=None, num_queries=50):
-    async with create_cosmos_client() as client:
+def build_query_tasks(container, basic_tenants, premium_tenants, product_types, throughput_bucket, num_queries, hedged_reader=None, sampler=None):
+    # Flattened task creation using itertools.product
+    basic_combos = itertools.product(
+        basic_tenants, product_types, range(num_queries)
+    )
+    premium_combos = itertools.product(
+        premium_tenants, product_types, range(num_queries)
+    )
+    return [
+        execute_query(container, tenant, True, None, type, hedged_reader, sampler)
+        for (tenant, type, i) in premium_combos
+    ] + [
+        execute_query(container, tenant, False, throughput_bucket, type, sampler=sampler)
+        for (tenant, type, i) in basic_combos
+    ]
+
+
+async def simulate_product_searches(throughput_bucket=None, num_queries=50, hedged_reads=False, sampler=None):
+    async with create_cosmos_client() as client, AsyncExitStack() as stack:
         db = client.get_database_client(DATABASE_NAME)
         container = db.get_container_client(CONTAINER_NAME)
 
+        # Premium reads can hedge through a second client (optionally in other regions)
+        hedged_reader = None
+        if hedged_reads:
+            hedge_client = await stack.enter_async_context(
+                create_cosmos_client(HEDGE_PREFERRED_LOCATIONS)
+            )
+            hedge_container = hedge_client.get_database_client(
+                DATABASE_NAME
+            ).get_container_client(CONTAINER_NAME)
+            hedged_reader = HedgedReader([container, hedge_container])
+
         basic_tenants = get_basic_sku_tenants()
         premium_tenants = get_premium_sku_tenants()
         product_types = get_all_product_types()
@@ -71,20 +133,9 @@ async def simulate_product_searches(throughput_bucket=None, num_queries=50):
         #     async with semaphore:
         #         return await single_query(*args, **kwargs)
 
-        # Flattened task creation using itertools.product
-        basic_combos = itertools.product(
-            basic_tenants, product_types, range(num_queries)
+        tasks = build_query_tasks(
+            container, basic_tenants, premium_tenants, product_types, throughput_bucket, num_queries, hedged_reader, sampler
         )
-        premium_combos = itertools.product(
-            premium_tenants, product_types, range(num_queries)
-        )
-        tasks = [
-            execute_query(container, tenant, True, None, type)
-            for (tenant, type, i) in premium_combos
-        ] + [
-            execute_query(container, tenant, False, throughput_bucket, type)
-            for (tenant, type, i) in basic_combos
-        ]
         
         total_tasks = len(tasks)
         basic_task_count = len(basic_tenants) * len(product_types) * num_queries
@@ -97,6 +148,8 @@ async def simulate_product_searches(throughput_bucket=None, num_queries=50):
         execution_time = time.time() - start
         logger.info(f"[Read Simulation] Completed all queries in {execution_time:.2f} seconds")
         log_stats(all_stats, basic_tenants, premium_tenants)
+        if hedged_reader is not None:
+            log_hedge_stats(hedged_reader.stats)
 
 
 def log_stats(all_stats, basic_tenants, premium_tenants):
@@ -107,7 +160,8 @@ def log_stats(all_stats, basic_tenants, premium_tenants):
     # Calculate basic tenant statistics
     total_basic_success = sum(s["success"] for s in basic_stats)
     total_basic_throttled = sum(s["throttled"] for s in basic_stats)
-    total_basic_operations = total_basic_success + total_basic_throttled
+    total_basic_deadline_exceeded = sum(s["deadline_exceeded"] for s in basic_stats)
+    total_basic_operations = total_basic_success + total_basic_throttled + total_basic_deadline_exceeded
     basic_throttled_percentage = (
         total_basic_throttled * 1.0 / total_basic_operations * 100 if total_basic_operations > 0 else 0
     )
@@ -115,7 +169,8 @@ def log_stats(all_stats, basic_tenants, premium_tenants):
     # Calculate premium tenant statistics
     total_premium_success = sum(s["success"] for s in premium_stats)
     total_premium_throttled = sum(s["throttled"] for s in premium_stats)
-    total_premium_operations = total_premium_success + total_premium_throttled
+    total_premium_deadline_exceeded = sum(s["deadline_exceeded"] for s in premium_stats)
+    total_premium_operations = total_premium_success + total_premium_throttled + total_premium_deadline_exceeded
     premium_throttled_percentage = (
         total_premium_throttled * 1.0 / total_premium_operations * 100 if total_premium_operations > 0 else 0
     )
@@ -126,9 +181,31 @@ def log_stats(all_stats, basic_tenants, premium_tenants):
     logger.info(f"    - Successful queries: {total_basic_success}")
     logger.info(f"    - Throttled queries: {total_basic_throttled}")
     logger.info(f"    - Throttling rate: {basic_throttled_percentage:.2f}%")
+    log_latency_and_charge(basic_stats)
     logger.info(f"")
     logger.info(f"  [Premium Tenant Details]:")
     logger.info(f"    - Total operations: {total_premium_operations}")
     logger.info(f"    - Successful queries: {total_premium_success}")
     logger.info(f"    - Throttled queries: {total_premium_throttled}")
+    logger.info(f"    - Deadline exceeded: {total_premium_deadline_exceeded}")
     logger.info(f"    - Throttling rate: {premium_throttled_percentage:.2f}%")
+    log_latency_and_charge(premium_stats)
+
+
+def log_latency_and_charge(stats):
+    # Latency of queries that got a response; RU across all attempts, so hedging cost shows up here
+    latencies = [s["latency_ms"] for s in stats if s["latency_ms"] is not None]
+    if latencies:
+        logger.info(f"    - Latency p50/p99: {percentile(latencies, 50):.1f}ms / {percentile(latencies, 99):.1f}ms")
+    logger.info(f"    - Request charge: {sum(s['request_charge'] for s in stats):.2f} RU")
+
+
+def log_hedge_stats(hedge_stats):
+    hedge_percentage = (
+        hedge_stats["hedged"] * 1.0 / hedge_stats["requests"] * 100 if hedge_stats["requests"] > 0 else 0
+    )
+    logger.info(f"")
+    logger.info(f"  [Premium Hedged Reads]:")
+    logger.info(f"    - Hedged requests: {hedge_stats['hedged']} ({hedge_percentage:.2f}% extra queries)")
+    logger.info(f"    - Hedge wins: {hedge_stats['hedge_wins']}")
+    logger.info(f"    - Deadline exceeded: {hedge_stats['deadline_exceeded']}")
@@ -11,7 +11,9 @@ logger = get_logger()
 # Current implementation uses synchronous CosmosClient which blocks during I/O operations
 # Consider using azure.cosmos.aio.CosmosClient with asyncio for concurrent ingestion
 
-INPUT_FILE = os.path.join(os.path.dirname(__file__), "data", "products.json")
+INPUT_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "products.json"
+)
 BATCH_SIZE = 100
 
 
@@ -20,9 +22,9 @@ def get_partition_key(doc):
     return [doc["tenant"], doc["id"]]
 
 
-def ingest_to_cosmos():
+def load_products(input_file=INPUT_FILE):
     # Load products
-    with open(INPUT_FILE, "r", encoding="utf-8") as f:
+    with open(input_file, "r", encoding="utf-8") as f:
         products = json.load(f)
 
     # Build a mapping: tenant -> sku (first encountered)
@@ -34,20 +36,16 @@ def ingest_to_cosmos():
             tenant_sku[tenant] = sku
 
     # Filter products: only keep docs where sku matches the tenant's assigned sku
-    filtered_products = [
+    return [
         doc for doc in products if doc["sku"] == tenant_sku[doc["tenant"]]
     ]
 
-    # Connect to Cosmos DB using managed identity
-    credential = DefaultAzureCredential()
-    client = CosmosClient(COSMOS_DB_URI, credential)
-    db = client.get_database_client(DATABASE_NAME)
-    container = db.get_container_client(CONTAINER_NAME)
 
+def ingest_products(container, products, batch_size=BATCH_SIZE):
     # Ingest in batches
     success, fail = 0, 0
-    for i in range(0, len(filtered_products), BATCH_SIZE):
-        batch = filtered_products[i : i + BATCH_SIZE]
+    for i in range(0, len(products), batch_size):
+        batch = products[i : i + batch_size]
         for doc in batch:
             try:
                 container.upsert_item(doc)
@@ -55,6 +53,18 @@ def ingest_to_cosmos():
             except exceptions.CosmosHttpResponseError as e:
                 logger.error(f"Failed to ingest doc id={doc.get('id')}: {e}")
                 fail += 1
-        logger.info(f"Ingested {i+len(batch)} / {len(filtered_products)}")
+        logger.info(f"Ingested {i+len(batch)} / {len(products)}")
+    return success, fail
+
+
+def ingest_to_cosmos():
+    filtered_products = load_products()
+
+    # Connect to Cosmos DB using managed identity
+    credential = DefaultAzureCredential()
+    client = CosmosClient(COSMOS_DB_URI, credential)
+    db = client.get_database_client(DATABASE_NAME)
+    container = db.get_container_client(CONTAINER_NAME)
 
+    success, fail = ingest_products(container, filtered_products)
     logger.info(f"Done. Success: {success}, Failed: {fail}")
@@ -0,0 +1,158 @@
+from core.bucket_controller import (
+    UNBUCKETED,
+    BucketController,
+    BucketPolicy,
+    BucketUsageSampler,
+    FakeManagementBackend,
+)
+
+INVENTORY = 1
+BASIC = 2
+WINDOW_SECONDS = 60
+TARGET_MS = 50
+
+
+class FakeClock:
+    def __init__(self, now=0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_policy(**overrides):
+    settings = dict(
+        premium_p99_target_ms=TARGET_MS,
+        min_percent=5,
+        max_percent=80,
+        step_percent=5,
+        starving_throttle_rate=0.05,
+        container_throughput=100,
+        configured_percentages={INVENTORY: 10, BASIC: 50},
+        floor_percentages={BASIC: 30},
+        priorities=[BASIC, INVENTORY],
+    )
+    settings.update(overrides)
+    return BucketPolicy(**settings)
+
+
+def make_controller(percentages, policy=None, **overrides):
+    clock = FakeClock()
+    sampler = BucketUsageSampler(WINDOW_SECONDS, clock=clock)
+    backend = FakeManagementBackend(percentages)
+    settings = dict(min_change_percent=5, cooldown_seconds=300, clock=clock)
+    settings.update(overrides)
+    controller = BucketController(backend, sampler, policy or make_policy(), **settings)
+    return controller, backend, sampler, clock
+
+
+def record(sampler, bucket, ru_per_second=0, throttle_rate=0.0, latency_ms=None, now=0):
+    # One sample standing in for a full window of traffic
+    sampler.record(bucket, ru_per_second * WINDOW_SECONDS, 100, 100 * throttle_rate, latency_ms, now=now)
+
+
+def premium_suffering(sampler, now=0):
+    record(sampler, UNBUCKETED, ru_per_second=10, latency_ms=TARGET_MS * 2, now=now)
+
+
+def premium_idle(sampler, now=0):
+    record(sampler, UNBUCKETED, ru_per_second=10, latency_ms=TARGET_MS * 0.1, now=now)
+
+
+def test_premium_pressure_shrinks_inventory_before_basic():
+    controller, backend, sampler, _ = make_controller({INVENTORY: 20, BASIC: 50})
+    premium_suffering(sampler)
+
+    assert controller.evaluate(now=0) == {INVENTORY: 15}
+    assert backend.percentages == {INVENTORY: 15, BASIC: 50}
+
+
+def test_basic_shrinks_once_inventory_is_at_minimum_but_not_below_floor():
+    controller, backend, sampler, _ = make_controller({INVENTORY: 5, BASIC: 35})
+    premium_suffering(sampler)
+    assert controller.evaluate(now=0) == {BASIC: 30}
+
+    premium_suffering(sampler, now=300)
+    assert controller.evaluate(now=300) is None
+    assert backend.percentages == {INVENTORY: 5, BASIC: 30}
+
+
+def test_cooldown_limits_changes():
+    controller, backend, sampler, clock = make_controller({INVENTORY: 30, BASIC: 50})
+    premium_suffering(sampler)
+    assert controller.evaluate(now=0) == {INVENTORY: 25}
+
+    premium_suffering(sampler, now=299)
+    assert controller.evaluate(now=299) is None
+
+    clock.now = 300
+    premium_suffering(sampler, now=300)
+    assert controller.evaluate() == {INVENTORY: 20}
+    assert len(backend.history) == 2
+
+
+def test_hysteresis_ignores_small_changes():
+    controller, backend, sampler, _ = make_controller(
+        {INVENTORY: 30, BASIC: 50}, policy=make_policy(step_percent=2)
+    )
+    premium_suffering(sampler)
+
+    assert controller.evaluate(now=0) is None
+    assert backend.history == []
+    # A rejected change does not start the cooldown
+    assert controller.last_change is None
+
+
+def test_growth_is_clamped_to_max_percent():
+    controller, backend, sampler, _ = make_controller({INVENTORY: 78, BASIC: 50}, min_change_percent=1)
+    premium_idle(sampler)
+    record(sampler, INVENTORY, ru_per_second=10, throttle_rate=0.5)
+
+    assert controller.evaluate(now=0) == {INVENTORY: 80}
+
+
+def test_growth_is_capped_by_free_ru():
+    controller, backend, sampler, _ = make_controller({INVENTORY: 40, BASIC: 50}, min_change_percent=1)
+    premium_idle(sampler)
+    # 10 + 40 + 47 of 100 RU/s in use leaves 3% to hand out
+    record(sampler, INVENTORY, ru_per_second=40, throttle_rate=0.5)
+    record(sampler, BASIC, ru_per_second=47, throttle_rate=0.5)
+
+    assert controller.evaluate(now=0) == {BASIC: 53}
+
+
+def test_higher_priority_bucket_grows_first():
+    controller, backend, sampler, _ = make_controller({INVENTORY: 20, BASIC: 50})
+    premium_idle(sampler)
+    # 10 + 20 + 65 of 100 RU/s in use leaves room for one step
+    record(sampler, INVENTORY, ru_per_second=20, throttle_rate=0.5)
+    record(sampler, BASIC, ru_per_second=65, throttle_rate=0.5)
+
+    assert controller.evaluate(now=0) == {BASIC: 55}
+
+
+def test_no_growth_inside_hysteresis_band():
+    controller, backend, sampler, _ = make_controller({INVENTORY: 20, BASIC: 50})
+    # Premium under target but above grow_below_ratio: hold steady
+    record(sampler, UNBUCKETED, ru_per_second=10, latency_ms=TARGET_MS * 0.8)
+    record(sampler, INVENTORY, ru_per_second=20, throttle_rate=0.5)
+
+    assert controller.evaluate(now=0) is None
+
+
+def test_relaxes_toward_configured_without_pressure():
+    controller, backend, sampler, _ = make_controller({INVENTORY: 40, BASIC: 35})
+    premium_idle(sampler)
+
+    assert controller.evaluate(now=0) == {INVENTORY: 35, BASIC: 40}
+
+
+def test_sampler_evicts_samples_outside_window():
+    sampler = BucketUsageSampler(WINDOW_SECONDS, clock=FakeClock())
+    sampler.record(INVENTORY, 600, requests=10, throttled=5, now=0)
+    sampler.record(INVENTORY, 60, requests=10, throttled=0, now=30)
+
+    assert sampler.ru_per_second(INVENTORY, now=59) == 11
+    assert sampler.throttle_rate(INVENTORY, now=59) == 0.25
+    assert sampler.ru_per_second(INVENTORY, now=60) == 1
+    assert sampler.throttle_rate(INVENTORY, now=60) == 0.0
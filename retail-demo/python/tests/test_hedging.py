@@ -0,0 +1,186 @@
+import asyncio
+import pytest
+from core.hedging import HedgeBudget, HedgedReader, LatencyTracker
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeReplica:
+    # Answers after `delay` seconds (never, if None) and records whether it was cancelled
+    def __init__(self, result=None, delay=0.0, error=None):
+        self.result = result
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def read(self):
+        self.calls += 1
+        try:
+            if self.delay is None:
+                await asyncio.Event().wait()
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def read_from(replica):
+    return replica.read()
+
+
+def make_reader(replicas, deadline_ms=1000, hedge_delay_ms=10, hedge_tokens=1, clock=None):
+    budget = HedgeBudget(ratio=hedge_tokens, burst=max(1, hedge_tokens))
+    tracker = LatencyTracker(initial_delay_ms=hedge_delay_ms)
+    if clock is None:
+        return HedgedReader(replicas, deadline_ms, budget, tracker)
+    return HedgedReader(replicas, deadline_ms, budget, tracker, clock=clock)
+
+
+def remaining_tasks():
+    return asyncio.all_tasks() - {asyncio.current_task()}
+
+
+def test_budget_earns_tokens_per_request_up_to_burst():
+    budget = HedgeBudget(ratio=0.5, burst=1)
+    assert not budget.try_acquire()
+
+    budget.on_request()
+    assert not budget.try_acquire()
+    budget.on_request()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+    for _ in range(10):
+        budget.on_request()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+
+def test_tracker_uses_initial_delay_until_enough_samples():
+    tracker = LatencyTracker(delay_percentile=50, window=20, initial_delay_ms=40, min_delay_ms=5)
+    tracker.record(10)
+    assert tracker.hedge_delay_ms() == 40
+
+    tracker.record(30)
+    assert tracker.hedge_delay_ms() == 10
+
+    tracker.samples.clear()
+    tracker.record(1)
+    tracker.record(2)
+    assert tracker.hedge_delay_ms() == 5
+
+
+def test_fast_primary_is_not_hedged():
+    async def scenario():
+        primary, secondary = FakeReplica("primary"), FakeReplica("secondary")
+        reader = make_reader([primary, secondary], hedge_delay_ms=1000)
+        assert await reader.read(read_from) == "primary"
+        assert secondary.calls == 0
+        assert reader.stats == {"requests": 1, "hedged": 0, "hedge_wins": 0, "deadline_exceeded": 0}
+
+    asyncio.run(scenario())
+
+
+def test_hedge_wins_and_cancels_slow_primary():
+    async def scenario():
+        primary, secondary = FakeReplica("primary", delay=None), FakeReplica("secondary")
+        reader = make_reader([primary, secondary])
+        assert await reader.read(read_from) == "secondary"
+        await asyncio.sleep(0)
+        assert primary.cancelled
+        assert not remaining_tasks()
+        assert reader.stats["hedged"] == 1
+        assert reader.stats["hedge_wins"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_empty_response_counts_as_a_win():
+    async def scenario():
+        primary, secondary = FakeReplica(None, delay=0.03), FakeReplica("secondary", delay=None)
+        reader = make_reader([primary, secondary])
+        assert await reader.read(read_from) is None
+        await asyncio.sleep(0)
+        assert secondary.cancelled
+        assert reader.stats["hedge_wins"] == 0
+        assert reader.stats["deadline_exceeded"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_no_hedge_without_budget():
+    async def scenario():
+        primary, secondary = FakeReplica("primary", delay=0.03), FakeReplica("secondary")
+        reader = make_reader([primary, secondary], hedge_tokens=0)
+        assert await reader.read(read_from) == "primary"
+        assert secondary.calls == 0
+        assert reader.stats["hedged"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_failed_primary_falls_back_to_hedge():
+    async def scenario():
+        primary = FakeReplica(delay=0.03, error=RuntimeError("primary failed"))
+        secondary = FakeReplica("secondary", delay=0.005)
+        reader = make_reader([primary, secondary])
+        assert await reader.read(read_from) == "secondary"
+        assert reader.stats["hedge_wins"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_error_is_raised_when_every_attempt_fails():
+    async def scenario():
+        primary = FakeReplica(error=RuntimeError("primary failed"))
+        reader = make_reader([primary, FakeReplica("secondary")], hedge_delay_ms=1000)
+        with pytest.raises(RuntimeError, match="primary failed"):
+            await reader.read(read_from)
+        assert reader.stats["deadline_exceeded"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_deadline_cancels_both_attempts():
+    async def scenario():
+        primary, secondary = FakeReplica(delay=None), FakeReplica(delay=None)
+        reader = make_reader([primary, secondary], deadline_ms=50)
+        with pytest.raises(asyncio.TimeoutError):
+            await reader.read(read_from)
+        await asyncio.sleep(0)
+        assert primary.cancelled and secondary.cancelled
+        assert not remaining_tasks()
+        assert reader.stats["deadline_exceeded"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_deadline_follows_injected_clock():
+    async def scenario():
+        clock = FakeClock()
+        primary = FakeReplica(delay=None)
+
+        async def read_and_stall(replica):
+            # Time jumps past the deadline while the primary is outstanding
+            clock.now += 2.0
+            return await replica.read()
+
+        reader = make_reader([primary, FakeReplica()], deadline_ms=100, hedge_delay_ms=5000, clock=clock)
+        with pytest.raises(asyncio.TimeoutError):
+            await reader.read(read_and_stall)
+        await asyncio.sleep(0)
+        assert primary.cancelled
+        assert reader.stats["hedged"] == 0
+        assert reader.stats["deadline_exceeded"] == 1
+
+    asyncio.run(scenario())